@@ -0,0 +1,34 @@
+"""
+PregnancyCare 360 - AI/ML Service
+
+Numba-compiled numeric kernels for the per-request risk scoring hot path.
+Keeping the scalar math in a jitted kernel removes interpreter overhead
+from every assessment; cache=True persists the compiled code across
+process restarts.
+"""
+
+import numpy as np
+from numba import njit
+
+# Condition weights for the overall risk score, ordered as
+# (preeclampsia, gestational_diabetes, preterm_birth)
+CONDITION_WEIGHTS = np.array([0.4, 0.3, 0.3])
+
+# Risk-level bucket boundaries: <30 low, <60 moderate, <80 high, >=80 critical
+RISK_THRESHOLDS = np.array([30.0, 60.0, 80.0])
+
+
+@njit(cache=True)
+def score_kernel(scores, weights):
+    """Compute (overall_score, risk_level_index) in one pass"""
+    overall = (scores * weights).sum()
+    level_idx = 0
+    for threshold in RISK_THRESHOLDS:
+        if overall >= threshold:
+            level_idx += 1
+    return overall, level_idx
+
+
+def warmup():
+    """Force JIT compilation at startup so the first request doesn't pay it"""
+    score_kernel(np.zeros(3, dtype=np.float64), CONDITION_WEIGHTS)